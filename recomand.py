@@ -5,9 +5,16 @@
 
 import streamlit as st
 import sqlite3
+import hashlib
+import hmac
+import threading
 import pandas as pd
 from datetime import datetime
 
+# Demo admin account; passwords are compared by SHA-256 hash
+ADMIN_USER = "admin"
+ADMIN_HASH = hashlib.sha256(b"admin123").hexdigest()
+
 st.set_page_config(
     page_title="MedCare Hospital Management",
     page_icon="🏥",
@@ -16,12 +23,26 @@ st.set_page_config(
 )
 
 # =========================================================================
-#  DATABASE HELPERS - fresh connection every time (most stable)
+#  DATABASE HELPERS - one shared connection per process
 # =========================================================================
+@st.cache_resource
 def get_db():
-    return sqlite3.connect('hospital.db', check_same_thread=False)
-
+    conn = sqlite3.connect('hospital.db', check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=134217728")   # 128 MB
+    conn.execute("PRAGMA cache_size=-20000")     # ~20 MB page cache
+    return conn
+
+@st.cache_resource
+def get_db_lock():
+    # Sessions share the connection above, so writes are serialized here
+    return threading.Lock()
+
+@st.cache_resource
 def init_db():
+    # Cached so the schema setup runs once per process, not on every rerun
     conn = get_db()
     c = conn.cursor()
 
@@ -56,11 +77,54 @@ def init_db():
         )'''
     ]
 
-    for sql in tables:
-        c.execute(sql)
+    # phone is UNIQUE, so SQLite already keeps an index on it
+    indexes = [
+        "CREATE INDEX IF NOT EXISTS idx_patients_lname ON patients(last_name, first_name)",
+        "CREATE INDEX IF NOT EXISTS idx_doctors_name ON doctors(name)",
+        "CREATE INDEX IF NOT EXISTS idx_staff_name ON staff(name)"
+    ]
+
+    # Trigram full-text index for substring patient search, kept in sync
+    # by triggers
+    fts = [
+        '''CREATE VIRTUAL TABLE IF NOT EXISTS patients_fts USING fts5(
+            first_name, last_name, phone,
+            content='patients', content_rowid='id', tokenize='trigram'
+        )''',
+        '''CREATE TRIGGER IF NOT EXISTS patients_ai AFTER INSERT ON patients BEGIN
+            INSERT INTO patients_fts(rowid, first_name, last_name, phone)
+            VALUES (new.id, new.first_name, new.last_name, new.phone);
+        END''',
+        '''CREATE TRIGGER IF NOT EXISTS patients_ad AFTER DELETE ON patients BEGIN
+            INSERT INTO patients_fts(patients_fts, rowid, first_name, last_name, phone)
+            VALUES ('delete', old.id, old.first_name, old.last_name, old.phone);
+        END''',
+        '''CREATE TRIGGER IF NOT EXISTS patients_au AFTER UPDATE ON patients BEGIN
+            INSERT INTO patients_fts(patients_fts, rowid, first_name, last_name, phone)
+            VALUES ('delete', old.id, old.first_name, old.last_name, old.phone);
+            INSERT INTO patients_fts(rowid, first_name, last_name, phone)
+            VALUES (new.id, new.first_name, new.last_name, new.phone);
+        END'''
+    ]
 
-    conn.commit()
-    conn.close()
+    with get_db_lock():
+        for sql in tables + indexes:
+            c.execute(sql)
+
+        fts_row = c.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='patients_fts'"
+        ).fetchone()
+        if fts_row and 'trigram' not in fts_row[0]:
+            # Older databases used the word tokenizer; recreate as trigram
+            c.execute("DROP TABLE patients_fts")
+            fts_row = None
+        for sql in fts:
+            c.execute(sql)
+        if not fts_row:
+            # Index rows that were added before the FTS table existed
+            c.execute("INSERT INTO patients_fts(patients_fts) VALUES ('rebuild')")
+
+    return True
 
 init_db()
 
@@ -69,36 +133,9 @@ if 'logged_in' not in st.session_state:
     st.session_state.logged_in = False
 
 # =========================================================================
-#  SIDEBAR – ALL YOUR REQUESTED MODULES
+#  LOGIN SCREEN – shown instead of the requested page until logged in
 # =========================================================================
-with st.sidebar:
-    st.title("🏥 MedCare HMS")
-    st.markdown("---")
-
-    if st.session_state.logged_in:
-        page = st.radio("Main Modules", [
-            "Dashboard",
-            "Patients (full CRUD)",
-            "Doctors (full CRUD)",
-            "Staff (full CRUD)",
-            "Appointments",
-            "Lab & Investigations",
-            "Pharmacy Inventory",
-            "Departments",
-            "Reports"
-        ])
-
-        st.markdown("---")
-        if st.button("Logout", type="primary", use_container_width=True):
-            st.session_state.logged_in = False
-            st.rerun()
-    else:
-        page = "Login"
-
-# =========================================================================
-#  LOGIN SCREEN
-# =========================================================================
-if not st.session_state.logged_in:
+def login_page():
     st.title("MedCare Hospital Management")
     st.subheader("Login (Demo Mode)")
 
@@ -108,74 +145,209 @@ if not st.session_state.logged_in:
         password = st.text_input("Password", type="password")
 
         if st.button("Login", type="primary"):
-            if username.strip() == "admin" and password == "admin123":
+            password_hash = hashlib.sha256(password.encode()).hexdigest()
+            if username.strip() == ADMIN_USER and hmac.compare_digest(password_hash, ADMIN_HASH):
                 st.session_state.logged_in = True
                 st.success("Login successful!")
                 st.rerun()
             else:
                 st.error("Invalid credentials")
                 st.info("Use: admin / admin123")
-    st.stop()
 
 # =========================================================================
-#  MAIN AREA
+#  QUERY HELPERS – cached reads, serialized writes
 # =========================================================================
-st.title(f"MedCare Hospital → {page}")
-st.markdown("---")
-
-# Safe database helper
-def run_query(sql, params=(), fetch_df=False, commit=False):
+# Reads take the write lock too, so they never see (and cache) rows from
+# a run_many batch that may still be rolled back
+@st.cache_data(ttl=30, show_spinner=False)
+def _read_cached(sql, params=()):
+    with get_db_lock():
+        cur = get_db().execute(sql, params)
+        cols = [d[0] for d in cur.description]
+        rows = cur.fetchall()
+    return pd.DataFrame.from_records(rows, columns=cols)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _read_rows_cached(sql, params=()):
+    with get_db_lock():
+        return get_db().execute(sql, params).fetchall()
+
+def _clear_read_caches():
+    _read_cached.clear()
+    _read_rows_cached.clear()
+
+def _write(sql, params=()):
+    # The connection is in autocommit mode, so each statement commits on
+    # its own; use run_many for work that must share a transaction
     conn = get_db()
-    try:
-        if fetch_df:
-            return pd.read_sql_query(sql, conn, params=params)
+    with get_db_lock():
         c = conn.cursor()
         c.execute(sql, params)
-        if commit:
-            conn.commit()
+    # Any write can change what the cached reads return
+    _clear_read_caches()
+
+def run_query(sql, params=(), fetch_df=False, fetch_one=False, fetch_scalar=False):
+    try:
+        if fetch_df:
+            return _read_cached(sql, tuple(params))
+        if fetch_one or fetch_scalar:
+            # Tuple rows skip pandas but still come from the read cache
+            rows = _read_rows_cached(sql, tuple(params))
+            row = rows[0] if rows else None
+            if fetch_scalar:
+                return row[0] if row else None
+            return row
+        _write(sql, params)
         return None
     except Exception as e:
         st.error(f"Database error: {str(e)}")
         return None
+
+def run_query_rows(sql, params=()):
+    # Plain tuples for widgets that don't need a DataFrame
+    try:
+        return _read_rows_cached(sql, tuple(params))
+    except Exception as e:
+        st.error(f"Database error: {str(e)}")
+        return []
+
+def run_many(sql, seq):
+    # One explicit transaction for the whole batch; the connection is
+    # in autocommit mode, so executemany alone would commit per row
+    conn = get_db()
+    try:
+        with get_db_lock():
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(sql, seq)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+    except Exception as e:
+        st.error(f"Database error: {str(e)}")
     finally:
-        conn.close()
+        _clear_read_caches()
+
+def load_patients():
+    # Served from the _read_cached cache until the next write
+    return run_query("SELECT id, first_name, last_name, phone, gender, blood_type FROM patients", fetch_df=True)
+
+def load_doctors():
+    return run_query("SELECT id, name, specialty, phone, department FROM doctors ORDER BY name", fetch_df=True)
+
+def load_staff():
+    return run_query("SELECT id, name, role, phone, department, status FROM staff ORDER BY name", fetch_df=True)
+
+# Above this many rows the list tab searches in SQL and caps the rows
+# shown instead of pulling the whole table into pandas
+PATIENT_FILTER_LIMIT = 10000
+
+def count_patients():
+    return run_query("SELECT COUNT(id) FROM patients", fetch_scalar=True) or 0
+
+def load_patients_head(limit=PATIENT_FILTER_LIMIT):
+    return run_query(
+        "SELECT id, first_name, last_name, phone, gender, blood_type FROM patients ORDER BY id LIMIT ?",
+        (limit,), fetch_df=True)
+
+def prefetch_all(patient_count):
+    # Warms the read cache so switching to a list page is a cache hit;
+    # large patient tables are left to the capped SQL path instead
+    if patient_count <= PATIENT_FILTER_LIMIT:
+        load_patients()
+    load_doctors()
+    load_staff()
+
+def patient_search_sql(term):
+    # Case-insensitive substring match on each column, the same as the
+    # pandas filter; the trigram index serves terms of 3+ characters
+    cols = "p.id, p.first_name, p.last_name, p.phone, p.gender, p.blood_type"
+    if len(term) >= 3:
+        # A quoted phrase is a literal substring to the trigram tokenizer
+        match = '"' + term.replace('"', '""') + '"'
+        return f"""
+            SELECT {cols} FROM patients p
+            WHERE p.id IN (SELECT rowid FROM patients_fts WHERE patients_fts MATCH ?)
+            LIMIT ?
+        """, (match, PATIENT_FILTER_LIMIT)
+
+    like = "%" + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + "%"
+    return f"""
+        SELECT {cols} FROM patients p
+        WHERE p.first_name LIKE ? ESCAPE '\\'
+           OR p.last_name LIKE ? ESCAPE '\\'
+           OR p.phone LIKE ? ESCAPE '\\'
+        LIMIT ?
+    """, (like, like, like, PATIENT_FILTER_LIMIT)
+
+def search_patients(term):
+    sql, params = patient_search_sql(term)
+    return run_query(sql, params, fetch_df=True)
 
 # ── DASHBOARD ──────────────────────────────────────────────────────────
-if page == "Dashboard":
+def dashboard_counts():
+    return run_query("""
+        SELECT (SELECT COUNT(id) FROM patients),
+               (SELECT COUNT(id) FROM doctors),
+               (SELECT COUNT(id) FROM staff)
+    """, fetch_one=True) or (0, 0, 0)
+
+# Fragments rerun on their own widget events instead of the whole script
+@st.fragment(run_every=60)
+def dashboard():
     c1, c2, c3 = st.columns(3)
 
-    p = run_query("SELECT COUNT(*) cnt FROM patients", fetch_df=True)['cnt'][0]
-    d = run_query("SELECT COUNT(*) cnt FROM doctors", fetch_df=True)['cnt'][0]
-    s = run_query("SELECT COUNT(*) cnt FROM staff", fetch_df=True)['cnt'][0]
+    row = dashboard_counts()
 
-    c1.metric("Patients", p or 0)
-    c2.metric("Doctors", d or 0)
-    c3.metric("Staff", s or 0)
+    c1.metric("Patients", row[0])
+    c2.metric("Doctors", row[1])
+    c3.metric("Staff", row[2])
 
 # ── PATIENTS – FULL CRUD + SEARCH ──────────────────────────────────────
-elif page == "Patients (full CRUD)":
-    tab1, tab2 = st.tabs(["List & Search", "Manage (Add/Edit/Delete)"])
-
-    # List + Search
-    with tab1:
-        search = st.text_input("Search name or phone", "")
-        q = "SELECT * FROM patients"
-        p = ()
-        if search:
-            q += " WHERE first_name LIKE ? OR last_name LIKE ? OR phone LIKE ?"
-            p = (f"%{search}%", f"%{search}%", f"%{search}%")
-
-        df = run_query(q, p, fetch_df=True)
-        if df is not None and not df.empty:
-            st.dataframe(df, use_container_width=True, hide_index=True)
+@st.fragment
+def patients_list():
+    # The form holds reruns until Search is pressed
+    with st.form("patient_search_form"):
+        st.text_input("Search name or phone", key="patient_search")
+        st.form_submit_button("Search")
+
+    search = st.session_state.patient_search.strip()
+    total = count_patients()
+    if total > PATIENT_FILTER_LIMIT:
+        # Too many rows for pandas; let SQLite filter and cap instead
+        if len(search) >= 2:
+            df = search_patients(search)
+            if df is not None and len(df) >= PATIENT_FILTER_LIMIT:
+                st.caption(f"Showing the first {PATIENT_FILTER_LIMIT} matches – refine the search to narrow down")
         else:
-            st.info("No patients found" if search else "No patients yet")
+            df = load_patients_head()
+            st.caption(f"Showing the first {PATIENT_FILTER_LIMIT} of {total} patients – search to narrow down")
+    else:
+        df = load_patients()
+        if df is not None and len(search) >= 2:
+            # Filter the cached frame instead of querying SQLite per keystroke
+            mask = (df['first_name'].str.contains(search, case=False, na=False, regex=False)
+                    | df['last_name'].str.contains(search, case=False, na=False, regex=False)
+                    | df['phone'].str.contains(search, case=False, na=False, regex=False))
+            df = df[mask]
+
+    if df is not None and not df.empty:
+        st.dataframe(df, use_container_width=True, hide_index=True)
+    else:
+        st.info("No patients found" if search else "No patients yet")
 
-    # Add / Edit / Delete
-    with tab2:
-        mode = st.radio("Action", ["Add New", "Edit / Delete"], horizontal=True)
+def option_index(options, value):
+    # "" and NULL/NaN from the Add form mean nothing was chosen
+    return options.index(value) if value in options else None
+
+@st.fragment
+def patients_manage():
+    mode = st.radio("Action", ["Add New", "Edit / Delete"], horizontal=True)
 
-        if mode == "Add New":
+    if mode == "Add New":
+        # Inputs inside a form only rerun the script on submit
+        with st.form("add_patient"):
             col1, col2 = st.columns(2)
             with col1:
                 fn = st.text_input("First Name*")
@@ -185,68 +357,102 @@ elif page == "Patients (full CRUD)":
                 g = st.selectbox("Gender", ["", "Male", "Female", "Other"])
                 blood = st.selectbox("Blood Group", ["", "A+", "A-", "B+", "B-", "O+", "O-", "AB+", "AB-"])
 
-            if st.button("Create Patient", type="primary"):
-                if fn and ln and ph:
-                    run_query("""
-                        INSERT INTO patients (first_name, last_name, phone, gender, blood_type)
-                        VALUES (?,?,?,?,?)
-                    """, (fn, ln, ph, g, blood), commit=True)
-                    st.success("Patient created!")
+            submitted = st.form_submit_button("Create Patient", type="primary")
+
+        if submitted:
+            if fn and ln and ph:
+                run_query("""
+                    INSERT INTO patients (first_name, last_name, phone, gender, blood_type)
+                    VALUES (?,?,?,?,?)
+                """, (fn, ln, ph, g, blood))
+                st.success("Patient created!")
+                st.rerun()
+            else:
+                st.warning("Required fields missing")
+
+    else:  # Edit/Delete
+        find = ""
+        if count_patients() > PATIENT_FILTER_LIMIT:
+            # Same cap as the list tab: search in SQL instead of one
+            # selectbox option per patient
+            find = st.text_input("Find patient (name or phone)", key="patient_edit_search").strip()
+        if len(find) >= 2:
+            rows = run_query_rows(*patient_search_sql(find))
+        else:
+            rows = run_query_rows(
+                "SELECT id, first_name, last_name, phone, gender, blood_type FROM patients ORDER BY id LIMIT ?",
+                (PATIENT_FILTER_LIMIT,))
+
+        if not rows:
+            st.info("No patients found" if find else "No patients yet")
+        else:
+            # Keyed on id so patients with identical labels stay selectable
+            row_by_id = {r[0]: r for r in rows}
+            pid = st.selectbox("Select patient", list(row_by_id),
+                               format_func=lambda i: f"{row_by_id[i][1]} {row_by_id[i][2]} ({row_by_id[i][3] or ''})")
+
+            # Row data is already in the selectbox rows
+            p = dict(zip(["id", "first_name", "last_name", "phone", "gender", "blood_type"], row_by_id[pid]))
+
+            with st.form("edit_patient"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    e_fn = st.text_input("First Name", value=p['first_name'])
+                    e_ln = st.text_input("Last Name", value=p['last_name'])
+                    e_ph = st.text_input("Phone", value=p['phone'])
+                with col2:
+                    genders = ["Male","Female","Other"]
+                    bloods = ["A+","A-","B+","B-","O+","O-","AB+","AB-"]
+                    e_gender = st.selectbox("Gender", genders, index=option_index(genders, p['gender']))
+                    e_blood = st.selectbox("Blood Group", bloods, index=option_index(bloods, p['blood_type']))
+
+                confirm = st.checkbox("Confirm permanent deletion")
+                c1, c2 = st.columns(2)
+                with c1:
+                    update = st.form_submit_button("Update Patient", type="primary")
+                with c2:
+                    delete = st.form_submit_button("Delete Patient", type="secondary")
+
+            if update:
+                run_query("""
+                    UPDATE patients SET
+                        first_name=?, last_name=?, phone=?, gender=?, blood_type=?
+                    WHERE id=?
+                """, (e_fn, e_ln, e_ph, e_gender, e_blood, pid))
+                st.success("Updated!")
+                st.rerun()
+
+            if delete:
+                if confirm:
+                    run_query("DELETE FROM patients WHERE id = ?", (pid,))
+                    st.success("Deleted!")
                     st.rerun()
                 else:
-                    st.warning("Required fields missing")
+                    st.warning("Tick the confirmation box to delete")
 
-        else:  # Edit/Delete
-            patients = run_query("SELECT id, first_name || ' ' || last_name || ' (' || phone || ')' label FROM patients", fetch_df=True)
+# ── PAGES ──────────────────────────────────────────────────────────────
+def dashboard_page():
+    dashboard()
+    # Same cached row the metrics just used, so no extra COUNT query
+    prefetch_all(dashboard_counts()[0])
 
-            if patients is None or patients.empty:
-                st.info("No patients yet")
-            else:
-                choice = st.selectbox("Select patient", patients['label'])
-                pid = patients[patients['label'] == choice]['id'].iloc[0]
-
-                # Load data
-                data = run_query("SELECT * FROM patients WHERE id = ?", (pid,), fetch_df=True)
-                if data is not None and not data.empty:
-                    p = data.iloc[0]
-
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        e_fn = st.text_input("First Name", value=p['first_name'])
-                        e_ln = st.text_input("Last Name", value=p['last_name'])
-                        e_ph = st.text_input("Phone", value=p['phone'])
-                    with col2:
-                        e_gender = st.selectbox("Gender", ["Male","Female","Other"], index=0 if pd.isna(p['gender']) else ["Male","Female","Other"].index(p['gender']))
-                        e_blood = st.selectbox("Blood Group", ["A+","A-","B+","B-","O+","O-","AB+","AB-"], index=0)
-
-                    c1, c2 = st.columns(2)
-                    with c1:
-                        if st.button("Update Patient", type="primary"):
-                            run_query("""
-                                UPDATE patients SET
-                                    first_name=?, last_name=?, phone=?, gender=?, blood_type=?
-                                WHERE id=?
-                            """, (e_fn, e_ln, e_ph, e_gender, e_blood, pid), commit=True)
-                            st.success("Updated!")
-                            st.rerun()
-
-                    with c2:
-                        if st.button("Delete Patient", type="secondary"):
-                            if st.checkbox("Confirm permanent deletion"):
-                                run_query("DELETE FROM patients WHERE id = ?", (pid,), commit=True)
-                                st.success("Deleted!")
-                                st.rerun()
+def patients_page():
+    tab1, tab2 = st.tabs(["List & Search", "Manage (Add/Edit/Delete)"])
 
-# ── DOCTORS & STAFF – FULL CRUD (similar pattern) ──────────────────────
-elif page in ["👨‍⚕️ Doctors (full CRUD)", "👩‍⚕️ Staff (full CRUD)"]:
-    table = "doctors" if "Doctors" in page else "staff"
-    title = "Doctor" if "Doctors" in page else "Staff Member"
+    # List + Search
+    with tab1:
+        patients_list()
 
+    # Add / Edit / Delete
+    with tab2:
+        patients_manage()
+
+# ── DOCTORS & STAFF – FULL CRUD (similar pattern) ──────────────────────
+def directory_page(table, title, df):
     st.subheader(f"{title} Management – Full CRUD")
     tab_list, tab_manage = st.tabs(["List", "Manage (Add/Edit/Delete)"])
 
     with tab_list:
-        df = run_query(f"SELECT * FROM {table} ORDER BY name", fetch_df=True)
         if df is not None:
             st.dataframe(df, use_container_width=True, hide_index=True)
 
@@ -258,17 +464,69 @@ elif page in ["👨‍⚕️ Doctors (full CRUD)", "👩‍⚕️ Staff (full CR
         2. Adjust fields accordingly
         """)
 
+def doctors_page():
+    directory_page("doctors", "Doctor", load_doctors())
+
+def staff_page():
+    directory_page("staff", "Staff Member", load_staff())
+
 # ── Remaining modules – placeholders ───────────────────────────────────
-else:
-    st.success(f"Module: {page}")
-    st.info("""
-    This module is prepared for implementation.
-
-    Recommended next steps:
-    1. Create corresponding table in init_database()
-    2. Copy the full CRUD pattern from Patients module
-    3. Adjust fields and table name
-    """)
+def placeholder_page(name, url_path):
+    def page():
+        st.success(f"Module: {name}")
+        st.info("""
+        This module is prepared for implementation.
+
+        Recommended next steps:
+        1. Create corresponding table in init_database()
+        2. Copy the full CRUD pattern from Patients module
+        3. Adjust fields and table name
+        """)
+    return st.Page(page, title=name, url_path=url_path)
+
+# =========================================================================
+#  NAVIGATION – Streamlit routes to and reruns only the active page
+# =========================================================================
+pages = [
+    st.Page(dashboard_page, title="Dashboard", default=True),
+    st.Page(patients_page, title="Patients (full CRUD)", url_path="patients"),
+    st.Page(doctors_page, title="Doctors (full CRUD)", url_path="doctors"),
+    st.Page(staff_page, title="Staff (full CRUD)", url_path="staff"),
+    placeholder_page("Appointments", "appointments"),
+    placeholder_page("Lab & Investigations", "lab"),
+    placeholder_page("Pharmacy Inventory", "pharmacy"),
+    placeholder_page("Departments", "departments"),
+    placeholder_page("Reports", "reports")
+]
+# Hidden so the sidebar below can place the links under its title
+pg = st.navigation(pages, position="hidden")
+
+# Pages are registered even when logged out, so a deep link such as
+# /patients resolves to its page; the login screen renders in its place
+# and the rerun after login opens the page that was asked for
+if not st.session_state.logged_in:
+    login_page()
+    st.stop()
+
+# =========================================================================
+#  SIDEBAR – ALL YOUR REQUESTED MODULES
+# =========================================================================
+with st.sidebar:
+    st.title("🏥 MedCare HMS")
+    st.markdown("---")
+
+    for page in pages:
+        st.page_link(page)
+
+    st.markdown("---")
+    if st.button("Logout", type="primary", use_container_width=True):
+        st.session_state.logged_in = False
+        st.rerun()
+
+st.title(f"MedCare Hospital → {pg.title}")
+st.markdown("---")
+
+pg.run()
 
 st.markdown("---")
 st.caption(f"MedCare Hospital Management System • {datetime.now().strftime('%Y-%m-%d')}")